@@ -1,24 +1,37 @@
 # Standard Library Imports
+import hashlib
 import json
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urljoin
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Sequence, Tuple
 
 # Third-Party Imports
 import requests
-from rich.console import Console
 
 # Local Imports
 from cmds.processing import check_media_types, filter_results
 from utils.helpers import (
+    console,
     display_api_results,
     display_failed_sites,
     display_missing_media_types,
     export_json,
 )
+from utils.cache import CACHE_DIR, DiskCache, MemoryCache
 from utils.exceptions import NoResultsFoundError
+from utils.http import (
+    TMDB_BURST,
+    TMDB_RATE_LIMIT,
+    TMDB_RETRIES,
+    SingleFlight,
+    get_host_bucket,
+    get_host_session,
+    limited_get,
+)
+from utils import json_codec
 from utils.logger import (
     LOG_PREFIX_API,
     LOG_PREFIX_FETCH,
@@ -28,8 +41,38 @@ from utils.logger import (
     LOG_PREFIX_RESULT,
     LOG_PREFIX_SEARCH,
 )
+from utils.validation import Tracker
+
+# Upper bound on concurrent tracker requests; per-host politeness is handled by the
+# adaptive limiter in utils.http, so every configured tracker can be in flight at once
+MAX_TRACKER_WORKERS = 16
+
+# Upper bound on concurrent JSON export writes
+MAX_EXPORT_WORKERS = 8
+
+# In-process and on-disk caches for TMDb responses; search results go stale faster than details
+TMDB_MEMORY_CACHE = MemoryCache(maxsize=1024)
+TMDB_CACHE = DiskCache(CACHE_DIR / "tmdb")
+
+# TMDb endpoint templates per search type: (details by ID, search by name)
+TMDB_ENDPOINTS = {
+    "movie": ("movie/{id}", "search/movie"),
+    "tv": ("tv/{id}", "search/tv"),
+}
+
+# On-disk cache for parsed tracker responses; seeders and new uploads change often
+TRACKER_CACHE = DiskCache(CACHE_DIR / "trackers")
+TRACKER_CACHE_TTL = 900
 
-console = Console()
+# Identical TMDb lookups that race each other share a single request
+TMDB_INFLIGHT = SingleFlight()
+TMDB_CACHE_TTL = 24 * 60 * 60
+TMDB_SEARCH_CACHE_TTL = 60 * 60
+
+@lru_cache(maxsize=8)
+def tmdb_base_url(tmdb_url: str) -> str:
+    """Normalize the TMDb base URL once so endpoints can be appended by concatenation."""
+    return tmdb_url.rstrip("/") + "/"
 
 def search_tmdb(
     logger: logging.Logger,
@@ -38,6 +81,7 @@ def search_tmdb(
     tmdb_url: Optional[str] = None,
     tmdb_id: Optional[str] = None,
     name: Optional[List[str]] = None,
+    no_cache: bool = False,
 ) -> Any:
     """
     Fetch details by ID or name for movies/series.
@@ -50,42 +94,48 @@ def search_tmdb(
         if not tmdb_api_key or not tmdb_url:
             raise ValueError("TMDb API key and URL must be provided.")
 
+        # Reject unknown search types before any request is made
+        try:
+            details_endpoint, search_endpoint = TMDB_ENDPOINTS[search_type]
+        except KeyError:
+            raise ValueError(f"Unknown search type: {search_type}")
+
         if tmdb_id:
-            logger.info(f"{LOG_PREFIX_FETCH} Fetching details for TMDb ID: {tmdb_id}")
-            endpoint = f"{search_type}/{tmdb_id}"
+            logger.info("%s Fetching details for TMDb ID: %s", LOG_PREFIX_FETCH, tmdb_id)
+            endpoint = details_endpoint.format(id=tmdb_id)
             params = {"api_key": tmdb_api_key}
-            return fetch_details(logger, endpoint, params, tmdb_url)
+            return fetch_details(logger, endpoint, params, tmdb_url, no_cache=no_cache)
 
         elif name:
             query = " ".join(name)
-            logger.info(f"{LOG_PREFIX_FETCH} Searching for '{query}' in '{search_type}'")
-            endpoint = f"search/{search_type}"
+            logger.info("%s Searching for '%s' in '%s'", LOG_PREFIX_FETCH, query, search_type)
+            endpoint = search_endpoint
             params = {"api_key": tmdb_api_key, "query": query}
-            response = fetch_details(logger, endpoint, params, tmdb_url)
+            response = fetch_details(logger, endpoint, params, tmdb_url, no_cache=no_cache)
             
             results = response.get("results", [])
             if not results:
-                logger.warning(f"{LOG_PREFIX_FETCH} No results found for query: {query}")
+                logger.warning("%s No results found for query: %s", LOG_PREFIX_FETCH, query)
                 raise NoResultsFoundError(query)
 
             return results
 
         else:
-            logger.error(f"{LOG_PREFIX_FETCH} Either 'tmdb_id' or 'name' must be provided.")
+            logger.error("%s Either 'tmdb_id' or 'name' must be provided.", LOG_PREFIX_FETCH)
             raise ValueError("You must provide either 'tmdb_id' or 'name' to search.")
 
     except NoResultsFoundError as e:
         query = " ".join(name) if name else "Unknown query"
-        logger.error(f"{LOG_PREFIX_FETCH} No results found for query: {query}")
+        logger.error("%s No results found for query: %s", LOG_PREFIX_FETCH, query)
         console.print(f"[bold red]Error:[/bold red] No results found for '{query}'")
         raise
 
     except ValueError as e:
-        logger.error(f"{LOG_PREFIX_FETCH} ValueError: {str(e)}")
+        logger.error("%s ValueError: %s", LOG_PREFIX_FETCH, e)
         raise
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_FETCH} Unexpected error: {str(e)}")
+        logger.error("%s Unexpected error: %s", LOG_PREFIX_FETCH, e)
         raise
 
 def fetch_details(
@@ -93,9 +143,10 @@ def fetch_details(
     endpoint: str,
     params: Dict[str, str],
     tmdb_url: Optional[str] = None,
+    no_cache: bool = False,
 ) -> Dict[str, Any]:
     """
-    Fetch details from the TMDb API.
+    Fetch details from the TMDb API, serving repeat requests from the on-disk cache.
     Returns:
         Parsed JSON response from the API.
     """
@@ -109,55 +160,95 @@ def fetch_details(
             raise ValueError("Params must be a dictionary.")
 
         # Construct the full URL
-        url = urljoin(tmdb_url, endpoint)
-        logger.info(f"{LOG_PREFIX_PROCESS} Constructed URL: {url}")
+        url = tmdb_base_url(tmdb_url) + endpoint.lstrip("/")
+        logger.info("%s Constructed URL: %s", LOG_PREFIX_PROCESS, url)
+
+        # Serve from memory, then disk, when possible; the API key is not part of the cache key
+        cache_key = json.dumps([url, sorted((k, v) for k, v in params.items() if k != "api_key")])
+        ttl = TMDB_SEARCH_CACHE_TTL if endpoint.startswith("search/") else TMDB_CACHE_TTL
+        if not no_cache:
+            cached = TMDB_MEMORY_CACHE.get(cache_key)
+            if cached is None:
+                cached = TMDB_CACHE.get(cache_key)
+                if cached is not None:
+                    TMDB_MEMORY_CACHE.set(cache_key, cached, expire=ttl)
+            if cached is not None:
+                logger.info("%s Using cached response for %s", LOG_PREFIX_FETCH, url)
+                return cached
+
+        # Make the request; concurrent callers with the same cache key wait for this one
+        def fetch() -> Dict[str, Any]:
+            logger.info("%s Sending request to %s with params: %s", LOG_PREFIX_FETCH, url, params)
+            get_host_bucket(url, rate=TMDB_RATE_LIMIT, capacity=TMDB_BURST).acquire()
+            response = get_host_session(url, retries=TMDB_RETRIES).get(url, params=params, timeout=10)
+            response.raise_for_status()
 
-        # Make the request
-        logger.info(f"{LOG_PREFIX_FETCH} Sending request to {url} with params: {params}")
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
+            # Parse and return the response
+            try:
+                data = json_codec.loads(response.content)
+                logger.debug("%s API Response: %s", LOG_PREFIX_RESULT, data)
+            except json_codec.JSONDecodeError:
+                logger.error("%s Received invalid JSON response from %s.", LOG_PREFIX_API, url)
+                raise ValueError("Invalid JSON response received from TMDb API.")
+
+            # Store the response; a cache write failure should never fail the lookup
+            TMDB_MEMORY_CACHE.set(cache_key, data, expire=ttl)
+            try:
+                TMDB_CACHE.set(cache_key, data, expire=ttl)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("%s Failed to cache response for %s: %s", LOG_PREFIX_API, url, e)
 
-        # Parse and return the response
-        try:
-            data = response.json()
-            logger.debug(f"{LOG_PREFIX_RESULT} API Response: {data}")
             return data
-        except requests.JSONDecodeError:
-            logger.error(f"{LOG_PREFIX_API} Received invalid JSON response from {url}.")
-            raise ValueError("Invalid JSON response received from TMDb API.")
 
-    except requests.Timeout:
-        logger.error(f"{LOG_PREFIX_API} Request to {url} timed out.")
-        raise ValueError("TMDb API request timed out.")
+        return TMDB_INFLIGHT.do(cache_key, fetch)
+
     except requests.RequestException as e:
-        logger.error(f"{LOG_PREFIX_API} Request to {url} failed: {str(e)}")
+        logger.error("%s Request to %s failed: %s", LOG_PREFIX_API, url, e)
         raise ValueError(f"TMDb API request failed: {str(e)}")
     except ValueError as e:
-        logger.error(f"{LOG_PREFIX_API} Validation error: {str(e)}")
+        logger.error("%s Validation error: %s", LOG_PREFIX_API, e)
         raise
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_API} Unexpected error: {str(e)}")
+        logger.error("%s Unexpected error: %s", LOG_PREFIX_API, e)
         raise
-    
+
+@lru_cache(maxsize=32)
+def tracker_headers(api_key: str) -> Mapping[str, str]:
+    """Build the read-only request headers for a tracker API key once and reuse them."""
+    return MappingProxyType({"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"})
+
+def fetch_tracker_content(logger: logging.Logger, url: str, api_key: str, tmdb_id: str) -> bytes:
+    """
+    Fetch a tracker's raw response for a TMDb ID through the host's rate limiter.
+    Failures raise requests.RequestException.
+    Returns:
+        bytes: The undecoded response body; the caller parses it and decides what to cache.
+    """
+    response = limited_get(logger, url, headers=tracker_headers(api_key), params={"tmdbId": tmdb_id}, timeout=10)
+    response.raise_for_status()
+    return response.content
+
 def query_tracker_api(
     logger: logging.Logger,
     tmdb_id: str,
     title: str,
     search_query: Optional[str] = None,
     media_type: Optional[str] = None,
-    trackers: Optional[List[Dict[str, str]]] = None,
+    trackers: Optional[Sequence[Tracker]] = None,
     output_json: Optional[bool] = None,
     OUTPUT_DIR: Optional[Path] = None,
+    pretty_json: bool = False,
+    no_cache: bool = False,
 ) -> None:
     """
     Query additional APIs using the TMDb ID and filter results by search query if applicable.
     """
     # Validate essential inputs
     if not trackers:
-        logger.error(f"{LOG_PREFIX_API} No trackers provided.")
+        logger.error("%s No trackers provided.", LOG_PREFIX_API)
         raise ValueError("Trackers list is required.")
     if not tmdb_id:
-        logger.error(f"{LOG_PREFIX_API} No TMDb ID provided.")
+        logger.error("%s No TMDb ID provided.", LOG_PREFIX_API)
         raise ValueError("TMDb ID is required.")
 
     # Initialize tracking variables
@@ -165,6 +256,7 @@ def query_tracker_api(
     successful_sites = []
     collected_data = []
     missing_media = {}
+    pending_display = []
 
     # Display search banner
     search_banner = (
@@ -177,50 +269,73 @@ def query_tracker_api(
         else f"Searching trackers for {title}"
     )
     console.rule(f"[bold yellow]{search_banner}[/bold yellow]", align="center")
-    logger.info(f"{LOG_PREFIX_SEARCH} {search_banner}")
+    logger.info("%s %s", LOG_PREFIX_SEARCH, search_banner)
 
     # Helper: Handle API responses
-    def handle_response(tracker_name: str, response: requests.Response) -> Optional[Dict[str, Any]]:
+    def handle_response(
+        tracker_name: str, content: bytes
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         try:
-            return response.json()
-        except json.JSONDecodeError:
+            return json_codec.loads(content), None
+        except json_codec.JSONDecodeError:
             logger.error(
-                f"{LOG_PREFIX_API} {tracker_name} returned invalid JSON: {response.text[:100]}..."
+                "%s %s returned invalid JSON: %s...",
+                LOG_PREFIX_API, tracker_name, content[:100].decode("utf-8", errors="replace")
             )
-            failed_sites[tracker_name] = "Invalid JSON response"
-            return None
+            return None, "Invalid JSON response"
 
-    # Helper: Process each tracker
-    def process_tracker(tracker: Dict[str, str]) -> None:
-        tracker_name = tracker.get("name", "Unknown Tracker")
-        api_key = tracker.get("api_key")
-        url = tracker.get("url")
-        tracker_code = tracker.get("code", "")
+    # Helper: Fetch a single tracker (runs on a worker thread)
+    def fetch_tracker(tracker: Tracker) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        tracker_name, api_key, url = tracker.name, tracker.api_key, tracker.url
 
         if not api_key or not url:
-            logger.warning(f"{LOG_PREFIX_API} Skipping {tracker_name}: Missing API key or URL.")
-            failed_sites[tracker_name] = "Missing API key or URL"
-            return
-
-        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
-        params = {"tmdbId": tmdb_id}
+            logger.warning("%s Skipping %s: Missing API key or URL.", LOG_PREFIX_API, tracker_name)
+            return None, "Missing API key or URL"
+
+        # Serve a recent response from disk when possible; results carry per-account download links,
+        # so entries are keyed by a digest of the API key rather than shared between accounts
+        cache_key = json.dumps([url, tmdb_id, hashlib.sha256(api_key.encode("utf-8")).hexdigest()])
+        if not no_cache:
+            cached = TRACKER_CACHE.get(cache_key)
+            if cached is not None:
+                logger.info("%s Using cached response for %s", LOG_PREFIX_FETCH, tracker_name)
+                return cached, None
 
         try:
-            logger.info(f"{LOG_PREFIX_SEARCH} Querying {tracker_name} for TMDb ID: {tmdb_id}")
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
+            logger.info("%s Querying %s for TMDb ID: %s", LOG_PREFIX_SEARCH, tracker_name, tmdb_id)
+            content = fetch_tracker_content(logger, url, api_key, tmdb_id)
+        except requests.RequestException as e:
+            logger.error("%s Request to %s failed: %s", LOG_PREFIX_API, tracker_name, e)
+            return None, str(e)
 
-            data = handle_response(tracker_name, response)
-            if not data:
-                logger.info(f"{LOG_PREFIX_PROCESS} {tracker_name} returned no data.")
-                return
+        data, failure_reason = handle_response(tracker_name, content)
 
-            collected_data.append((data, tracker_code, tracker_name))
-            process_tracker_data(tracker_name, data)
+        # Store the parsed response before it is filtered; a cache write failure should never fail the query
+        if data is not None:
+            try:
+                TRACKER_CACHE.set(cache_key, data, expire=TRACKER_CACHE_TTL)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("%s Failed to cache response for %s: %s", LOG_PREFIX_API, tracker_name, e)
 
-        except requests.RequestException as e:
-            logger.error(f"{LOG_PREFIX_API} Request to {tracker_name} failed: {str(e)}")
-            failed_sites[tracker_name] = str(e)
+        return data, failure_reason
+
+    # Helper: Process each tracker's fetched response
+    def process_tracker(
+        tracker: Tracker, result: Tuple[Optional[Dict[str, Any]], Optional[str]]
+    ) -> None:
+        tracker_name, tracker_code = tracker.name, tracker.code
+        data, failure_reason = result
+
+        if failure_reason:
+            failed_sites[tracker_name] = failure_reason
+            return
+
+        if not data:
+            logger.info("%s %s returned no data.", LOG_PREFIX_PROCESS, tracker_name)
+            return
+
+        collected_data.append((data, tracker_code, tracker_name))
+        process_tracker_data(tracker_name, data)
 
     # Helper: Process tracker data
     def process_tracker_data(tracker_name: str, data: Dict[str, Any]) -> None:
@@ -239,7 +354,7 @@ def query_tracker_api(
                         reason.append(f"of media type '{media_type}'")
                     reason_str = " and ".join(reason)
 
-                    logger.info(f"{LOG_PREFIX_PROCESS} No results found on {tracker_name}: {reason_str}.")
+                    logger.info("%s No results found on %s: %s.", LOG_PREFIX_PROCESS, tracker_name, reason_str)
                     failed_sites[tracker_name] = f"No results {reason_str}"
                     return
                 
@@ -250,40 +365,58 @@ def query_tracker_api(
                 # Only check media types when neither search_query nor media_type is set
                 check_media_types(logger, data, tracker_name, missing_media)
 
-            display_api_results(logger, data, tracker_name)
+            pending_display.append((data, tracker_name))
             successful_sites.append(tracker_name)
         else:
-            logger.info(f"{LOG_PREFIX_PROCESS} No matching results on {tracker_name}.")
+            logger.info("%s No matching results on %s.", LOG_PREFIX_PROCESS, tracker_name)
             failed_sites[tracker_name] = "No matching results"
 
-    # Iterate over trackers and process each
-    for tracker in trackers:
-        process_tracker(tracker)
-        time.sleep(1)  # Avoid rate-limiting
+    # Query trackers concurrently; results are processed in tracker order as they complete
+    max_workers = min(MAX_TRACKER_WORKERS, len(trackers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for tracker, result in zip(trackers, executor.map(fetch_tracker, trackers)):
+            process_tracker(tracker, result)
+
+    # Render result tables and the summary in one buffered write once the fan-out has finished
+    with console:
+        for data, tracker_name in pending_display:
+            display_api_results(logger, data, tracker_name)
+
+        logger.info("%s Checking for failed sites...", LOG_PREFIX_PROCESS)
+
+        # Display results summary
+        if failed_sites:
+            logger.info("%s Gathering failed sites...", LOG_PREFIX_PROCESS)
+            display_failed_sites(logger, failed_sites)
+        else:
+            logger.info("%s No failed sites found.", LOG_PREFIX_PROCESS)
+
+        logger.info("%s Checking for missing media types...", LOG_PREFIX_PROCESS)
+
+        if missing_media:
+            logger.info("%s Gathering missing media types...", LOG_PREFIX_PROCESS)
+            display_missing_media_types(logger, missing_media)
+        else:
+            logger.info("%s All media types found on configured sites.", LOG_PREFIX_PROCESS)
+
+        if not successful_sites:
+            logger.error("%s No successful queries.", LOG_PREFIX_OUTPUT)
+            console.print("[bold red]No successful queries.[/bold red]")
 
     # Export collected data to JSON if requested
-    if output_json and OUTPUT_DIR:
-        logger.info(f"{LOG_PREFIX_JSON} Exporting tracker data to: {OUTPUT_DIR}")
-        for data, tracker_code, tracker_name in collected_data:
-            export_json(logger, OUTPUT_DIR, data, tracker_code, tracker_name, tmdb_id)
-
-    logger.info(f"{LOG_PREFIX_PROCESS} Checking for failed sites...")
-
-    # Display results summary
-    if failed_sites:
-        logger.info(f"{LOG_PREFIX_PROCESS} Gathering failed sites...")
-        display_failed_sites(logger, failed_sites)
-    else:
-        logger.info(f"{LOG_PREFIX_PROCESS} No failed sites found.")
-    
-    logger.info(f"{LOG_PREFIX_PROCESS} Checking for missing media types...")
-
-    if missing_media:
-        logger.info(f"{LOG_PREFIX_PROCESS} Gathering missing media types...")
-        display_missing_media_types(logger, missing_media)
-    else:
-        logger.info(f"{LOG_PREFIX_PROCESS} All media types found on configured sites.")
-
-    if not successful_sites:
-        logger.error(f"{LOG_PREFIX_OUTPUT} No successful queries.")
-        console.print("[bold red]No successful queries.[/bold red]")
\ No newline at end of file
+    if output_json and OUTPUT_DIR and collected_data:
+        logger.info("%s Exporting tracker data to: %s", LOG_PREFIX_JSON, OUTPUT_DIR)
+        OUTPUT_DIR = Path(OUTPUT_DIR)
+        try:
+            OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            # Like a failed export, an unusable output directory is logged without failing the search
+            logger.error("%s Could not create output directory %s: %s", LOG_PREFIX_JSON, OUTPUT_DIR, e)
+            return
+
+        # Write files concurrently; export_json logs and swallows its own errors
+        with ThreadPoolExecutor(max_workers=min(MAX_EXPORT_WORKERS, len(collected_data))) as executor:
+            for data, tracker_code, tracker_name in collected_data:
+                executor.submit(
+                    export_json, logger, OUTPUT_DIR, data, tracker_code, tracker_name, tmdb_id, pretty_json
+                )
@@ -4,11 +4,12 @@ import sys
 from typing import Any, Dict, List, Optional
 
 # Third-Party Imports
-from rich.console import Console
+from rich.prompt import Prompt
+from rich.text import Text
 
 # Local Imports
-from utils.exceptions import InvalidChoiceError, NoResultsError
-from utils.helpers import create_table
+from utils.exceptions import InvalidChoiceError, NoResultsError, UserAbortError
+from utils.helpers import console, create_table, parse_query_terms, print_table
 from utils.logger import (
     LOG_PREFIX_INPUT,
     LOG_PREFIX_OUTPUT,
@@ -17,7 +18,22 @@ from utils.logger import (
 )
 from utils.validation import MEDIA_TYPES
 
-console = Console()
+# Reverse lookup from each media type synonym to its category, built once at import
+SYNONYM_TO_CATEGORY = {
+    synonym: category for category, synonyms in MEDIA_TYPES.items() for synonym in synonyms
+}
+ALL_SYNONYMS = frozenset(SYNONYM_TO_CATEGORY)
+SYNONYM_ITEMS = tuple(SYNONYM_TO_CATEGORY.items())
+
+# Prompt shown when asking the user to pick a TMDb result
+CHOICE_PROMPT = "\nEnter the index of the correct result, or type 'none' if none are correct"
+
+# Help shown when the user rejects every TMDb result
+NO_MATCH_HELP = (
+    "\n[bold yellow]If you're confident the media exists on TMDb, please double-check the title's spelling for accuracy.\n"
+    "TMDb searches across original, translated, and alternative titles, but precise spelling helps achieve the best results.\n"
+    "Alternatively, you can use the `--id` option if you know the entry exists on TMDb.[/bold yellow]"
+)
 
 def display_results_table(logger: logging.Logger, results: List[Dict[str, str]]) -> None:
     """Display search results in a table."""
@@ -28,6 +44,19 @@ def display_results_table(logger: logging.Logger, results: List[Dict[str, str]])
         if not isinstance(results, list) or not all(isinstance(r, dict) for r in results):
             raise TypeError("Results must be a list of dictionaries.")
 
+        # Skip Rich's layout work when output is not a terminal; a TMDb page is too short to need it otherwise
+        if not console.is_terminal:
+            lines = []
+            for index, result in enumerate(results, start=1):
+                get = result.get
+                title = get("title") or get("name") or "N/A"
+                release_date = get("release_date") or get("first_air_date") or "N/A"
+                lines.append(f"{index:>4}  {title}  {release_date[:4]}")
+            logger.info("%s Displaying %s as plain text.", LOG_PREFIX_OUTPUT, table_name)
+            # console.out skips markup and wrapping but still honours an active console buffer
+            console.out("\n".join(lines), highlight=False)
+            return
+
         # Define table columns
         columns = [
             ("Index", "bold green", "center"),
@@ -35,29 +64,29 @@ def display_results_table(logger: logging.Logger, results: List[Dict[str, str]])
             ("Release Year", "bold yellow", "center"),
         ]
 
-        # Populate rows
-        rows = []
-        for index, result in enumerate(results, start=1):
-            # Safely extract the title and release year
-            title = result.get("title", result.get("name", "N/A"))
-            release_date = result.get("release_date", result.get("first_air_date", "N/A"))
-            release_year = release_date[:4] if release_date != "N/A" else "N/A"
-            rows.append([str(index), title, release_year])
-
-        # Create and display the table
+        # Create the table, then add rows directly without an intermediate list
         table = create_table(
             logger=logger,
             title=table_name,
             columns=columns,
-            rows=rows,
             title_style="bold green",
             border_style="bold white",
         )
-        logger.info(f"{LOG_PREFIX_OUTPUT} Displaying {table_name} table.")
-        console.print(table)
+
+        # Populate rows with plain Text cells so titles skip markup parsing
+        add_row = table.add_row
+        for index, result in enumerate(results, start=1):
+            # Safely extract the title and release year, with the same fallbacks as the plain-text path
+            get = result.get
+            title = get("title") or get("name") or "N/A"
+            release_date = get("release_date") or get("first_air_date") or "N/A"
+            add_row(Text(str(index)), Text(title), Text(release_date[:4]))
+
+        logger.info("%s Displaying %s table.", LOG_PREFIX_OUTPUT, table_name)
+        print_table(table)
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_OUTPUT} Error displaying {table_name} table: {str(e)}")
+        logger.error("%s Error displaying %s table: %s", LOG_PREFIX_OUTPUT, table_name, e)
         console.print(f"[bold red]Error:[/bold red] Failed to display the table.")
         sys.exit(1)
 
@@ -67,26 +96,22 @@ def get_user_choice(logger: logging.Logger, num_results: int) -> Optional[int]:
     Returns:
         The zero-based index of the selected result, or None if the user chooses 'none'.
     """
-    while True:
-        # Prompt the user for input
-        choice = console.input(
-            "\nEnter the index of the correct result, or type 'none' if none are correct: "
-        ).strip().lower()
-
-        # Handle the 'none' option
-        if choice == "none":
-            logger.info(f"{LOG_PREFIX_INPUT} User chose 'none', no result selected.")
-            return None
-
-        # Handle numeric input within the valid range
-        if choice.isdigit():
-            choice_int = int(choice)
-            if 1 <= choice_int <= num_results:
-                logger.info(f"{LOG_PREFIX_INPUT} User selected result at index: {choice}")
-                return choice_int - 1  # Convert to zero-based index
-
-        # If input is invalid, show an error message and loop again
-        console.print("[bold red]Invalid choice. Please enter a valid index or 'none'.[/bold red]")
+    # Prompt re-asks on its own until the answer is one of the allowed choices; 'None' and 'NONE' also match
+    choice = Prompt.ask(
+        CHOICE_PROMPT,
+        choices=[*map(str, range(1, num_results + 1)), "none"],
+        case_sensitive=False,
+        show_choices=False,
+        console=console,
+    )
+
+    # Handle the 'none' option
+    if choice == "none":
+        logger.info("%s User chose 'none', no result selected.", LOG_PREFIX_INPUT)
+        return None
+
+    logger.info("%s User selected result at index: %s", LOG_PREFIX_INPUT, choice)
+    return int(choice) - 1  # Convert to zero-based index
 
 def select_tmdb_result(logger: logging.Logger, results: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """
@@ -99,14 +124,14 @@ def select_tmdb_result(logger: logging.Logger, results: List[Dict[str, Any]]) ->
         if not results:
             raise NoResultsError("No results to process.")
 
-        logger.info(f"{LOG_PREFIX_PROCESS} Processing {len(results)} search results.")
+        logger.info("%s Processing %s search results.", LOG_PREFIX_PROCESS, len(results))
 
         # Automatically select the only result
         if len(results) == 1:
             selected = results[0]
             title = selected.get("title", selected.get("name", "N/A"))
             console.print(f"[bold yellow]Automatically selected:[/bold yellow] {title}")
-            logger.info(f"{LOG_PREFIX_PROCESS} Automatically selected result: {selected}")
+            logger.debug("%s Automatically selected result: %s", LOG_PREFIX_PROCESS, selected)
             return selected
 
         # Display results for user selection
@@ -115,38 +140,29 @@ def select_tmdb_result(logger: logging.Logger, results: List[Dict[str, Any]]) ->
         # Get the user's choice
         choice_index = get_user_choice(logger, len(results))
         if choice_index is None:
-            console.print(
-                "\n[bold yellow]If you're confident the media exists on TMDb, please double-check the title's spelling for accuracy.[/bold yellow]"
-            )
-            console.print(
-                "[bold yellow]TMDb searches across original, translated, and alternative titles, but precise spelling helps achieve the best results.[/bold yellow]"
-            )
-            console.print(
-                "[bold yellow]Alternatively, you can use the `--id` option if you know the entry exists on TMDb.[/bold yellow]"
-            )
-            logger.info(f"{LOG_PREFIX_INPUT} User chose 'none', exiting script.")
-            sys.exit(0)  # Exit gracefully if the user selects 'none'
+            console.print(NO_MATCH_HELP)
+            logger.info("%s User chose 'none', exiting script.", LOG_PREFIX_INPUT)
+            raise UserAbortError()  # Let the caller unwind gracefully if the user selects 'none'
 
         # Validate the user's choice and return the selected result
         if 0 <= choice_index < len(results):
             selected = results[choice_index]
-            logger.info(f"{LOG_PREFIX_INPUT} User selected result: {selected}")
+            logger.debug("%s User selected result: %s", LOG_PREFIX_INPUT, selected)
             return selected
         else:
             raise InvalidChoiceError(f"Choice {choice_index} is out of range.")
 
-    except NoResultsError as e:
-        logger.error(f"{LOG_PREFIX_PROCESS} {str(e)}")
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+    except (NoResultsError, InvalidChoiceError) as e:
+        prefix = LOG_PREFIX_INPUT if isinstance(e, InvalidChoiceError) else LOG_PREFIX_PROCESS
+        logger.error("%s %s", prefix, e)
+        console.print("[bold red]Error:[/bold red]", e)
         raise
 
-    except InvalidChoiceError as e:
-        logger.error(f"{LOG_PREFIX_INPUT} {str(e)}")
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+    except UserAbortError:
         raise
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_PROCESS} Unexpected error: {str(e)}")
+        logger.error("%s Unexpected error: %s", LOG_PREFIX_PROCESS, e)
         console.print(f"[bold red]Error:[/bold red] Unexpected error occurred.")
         raise
 
@@ -164,42 +180,47 @@ def check_media_types(
 
     try:
         # Log start of the media type check process
-        logger.info(f"{LOG_PREFIX_PROCESS} Checking missing media types for {tracker_name}...")
+        logger.info("%s Checking missing media types for %s...", LOG_PREFIX_PROCESS, tracker_name)
 
-        # Extract media types found on the tracker
-        site_media_types = [
+        # Extract the distinct media types found on the tracker
+        site_media_types = {
             item["attributes"]["type"].lower()
             for item in data.get("data", [])
             if "type" in item.get("attributes", {})
-        ]
+        }
 
         # Log and track unknown media types
-        all_synonyms = {synonym for synonyms in MEDIA_TYPES.values() for synonym in synonyms}
-        unknown_media_types = set(site_media_types) - all_synonyms
+        unknown_media_types = site_media_types - ALL_SYNONYMS
         if unknown_media_types:
-            logger.warning(f"{LOG_PREFIX_PROCESS} Unknown media types on {tracker_name}: {unknown_media_types}")
+            logger.warning("%s Unknown media types on %s: %s", LOG_PREFIX_PROCESS, tracker_name, unknown_media_types)
 
-        # Determine found categories based on synonyms
+        # Map each distinct site type to categories; exact synonyms resolve with one dict lookup
         found_categories = set()
         for site_type in site_media_types:
-            for category, synonyms in MEDIA_TYPES.items():
-                if site_type in synonyms or any(synonym in site_type for synonym in synonyms):
+            category = SYNONYM_TO_CATEGORY.get(site_type)
+            if category is not None:
+                found_categories.add(category)
+                continue
+
+            # Fall back to a substring scan for composite types such as "web-dl remux"
+            for synonym, category in SYNONYM_ITEMS:
+                if synonym in site_type:
                     found_categories.add(category)
 
-        # Identify missing media types
-        for category in MEDIA_TYPES.keys():
-            if category not in found_categories:
-                missing_media.setdefault(tracker_name, []).append(category)
-                logger.info(f"{LOG_PREFIX_PROCESS} Media type '{category}' not found on {tracker_name}")
+        # Identify missing media types, keeping MEDIA_TYPES order for display
+        missing_categories = [category for category in MEDIA_TYPES if category not in found_categories]
+        if missing_categories:
+            missing_media.setdefault(tracker_name, []).extend(missing_categories)
+            logger.info("%s Media types %s not found on %s", LOG_PREFIX_PROCESS, missing_categories, tracker_name)
 
         return missing_media
 
     except KeyError as e:
-        logger.error(f"{LOG_PREFIX_PROCESS} KeyError encountered while processing {tracker_name}: {e}")
+        logger.error("%s KeyError encountered while processing %s: %s", LOG_PREFIX_PROCESS, tracker_name, e)
         return missing_media
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_PROCESS} Unexpected error while processing {tracker_name}: {e}")
+        logger.error("%s Unexpected error while processing %s: %s", LOG_PREFIX_PROCESS, tracker_name, e)
         return missing_media   
 
 def filter_results(
@@ -221,39 +242,34 @@ def filter_results(
         List[Dict[str, Any]]: A list of filtered results matching the criteria.
     """
     try:
-        # Parse search query terms
-        query_terms = (
-            [term.strip().lower() for term in search_query.split("^")]
-            if search_query
-            else []
-        )
+        # Parse search query terms and normalize the media type once, not per item
+        query_terms = parse_query_terms(search_query) if search_query else ()
+        media_type_lower = media_type.lower() if media_type else None
 
-        # Filter results
+        # Filter results, lowercasing each field at most once and only when it is checked
         results = []
         for item in data.get("data", []):
             attributes = item.get("attributes", {})
-            name = attributes.get("name", "").lower()
-            type_ = attributes.get("type", "").lower()
 
-            # Check search query terms
-            query_match = all(term in name for term in query_terms) if query_terms else True
+            # Check search query terms; map() keeps the per-term scan in C
+            if query_terms and not all(map(attributes.get("name", "").lower().__contains__, query_terms)):
+                continue
 
             # Check media type
-            type_match = media_type.lower() == type_ if media_type else True
+            if media_type_lower and attributes.get("type", "").lower() != media_type_lower:
+                continue
 
-            # Include item if both conditions match
-            if query_match and type_match:
-                results.append(item)
+            results.append(item)
 
         logger.info(
-            f"{LOG_PREFIX_SEARCH} Filtered {len(results)} result(s) "
-            f"based on query: '{search_query}' and media type: '{media_type}'"
+            "%s Filtered %s result(s) based on query: '%s' and media type: '%s'",
+            LOG_PREFIX_SEARCH, len(results), search_query, media_type
         )
         return results
 
     except KeyError as e:
-        logger.error(f"{LOG_PREFIX_SEARCH} KeyError while filtering results: {e}")
+        logger.error("%s KeyError while filtering results: %s", LOG_PREFIX_SEARCH, e)
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_SEARCH} Unexpected error during filtering: {e}")
+        logger.error("%s Unexpected error during filtering: %s", LOG_PREFIX_SEARCH, e)
 
     return []  # Return an empty list if an exception occurs
\ No newline at end of file
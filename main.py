@@ -1,25 +1,33 @@
 from pathlib import Path
-from utils.validation import setup_environment, API_KEYS
-from utils.helpers import display_movie_details, parse_arguments
-from utils.logger import LOG_PREFIX_CONFIG, LOG_PREFIX_INPUT, LOG_PREFIX_SEARCH, LOG_PREFIX_SUMMARY, LOG_PREFIX_TASK, LOG_PREFIX_VALIDATE, setup_logging
+from utils.validation import get_api_key_values, setup_environment
+from utils.helpers import console, display_movie_details, parse_arguments
+from utils.logger import LOG_PREFIX_CONFIG, LOG_PREFIX_INPUT, LOG_PREFIX_SEARCH, LOG_PREFIX_SUMMARY, LOG_PREFIX_TASK, setup_logging
 from cmds.processing import select_tmdb_result
 from cmds.api_commands import search_tmdb, query_tracker_api
-from rich.console import Console
-from utils.exceptions import MissingArgumentError, InvalidTMDbIDError, NoSuitableResultError
+from utils.exceptions import (
+    InvalidTMDbIDError,
+    MissingArgumentError,
+    MissingEnvironmentVariableError,
+    NoSuitableResultError,
+    NoValidTrackersError,
+    UserAbortError,
+)
+from utils.http import close_sessions
 import logging
 from logging import NullHandler
 
-console = Console()
-
 # Determine the directory of the script and the output folder
 SCRIPT_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = SCRIPT_DIR / "logs"
 
+# No-op logger used when logging is disabled; configured once so handlers never accumulate
+_NULL_LOGGER = logging.getLogger("media_finder.null")
+_NULL_LOGGER.addHandler(NullHandler())
+_NULL_LOGGER.propagate = False
+
 def get_null_logger():
     """Returns a no-op logger to avoid attribute errors when logging is disabled."""
-    logger = logging.getLogger("null_logger")
-    logger.addHandler(NullHandler())
-    return logger
+    return _NULL_LOGGER
 
 def setup(args, logger):
     """Setup logging and environment variables."""
@@ -30,22 +38,15 @@ def setup(args, logger):
     tmdb_api_key = env_vars["required"]["TMDB_API_KEY"]
     tmdb_url = env_vars["required"]["TMDB_URL"]
 
-    # Retrieve valid tracker API key and URL pairs
+    # Retrieve valid tracker API key and URL pairs; each is logged as it is validated
     trackers = env_vars["trackers"]
-    for tracker in trackers:
-        url = tracker["url"]
-        tracker_name = tracker["name"]
-        tracker_code = tracker["code"]
-        
-        # Log the tracker information
-        logger.info(f"{LOG_PREFIX_VALIDATE} {tracker_name} ({tracker_code}) | Using provided API key with URL: {url}")
 
     return tmdb_api_key, tmdb_url, trackers
 
 def perform_search(logger, args, tmdb_api_key, tmdb_url, trackers):
     """Perform the search based on the provided arguments."""
     # Log all arguments used
-    logger.info(f"{LOG_PREFIX_TASK} Performing search with arguments: {vars(args)}")
+    logger.info("%s Performing search with arguments: %s", LOG_PREFIX_TASK, args)
 
     # Determine the search type based on the arguments
     search_type = "movie" if args.movies else "tv" if args.series else None
@@ -53,34 +54,34 @@ def perform_search(logger, args, tmdb_api_key, tmdb_url, trackers):
 
     # Ensure a valid search type is specified
     if not search_type:
-        logger.error(f"{LOG_PREFIX_INPUT} Please specify either --movies or --series to search.")
+        logger.error("%s Please specify either --movies or --series to search.", LOG_PREFIX_INPUT)
         raise MissingArgumentError("Please specify either --movies or --series to search.")
     
-    logger.info(f"{LOG_PREFIX_CONFIG} TMDb URL: {tmdb_url}")
+    logger.info("%s TMDb URL: %s", LOG_PREFIX_CONFIG, tmdb_url)
 
     # Search by TMDb ID if provided
     if args.id:
         tmdb_id = args.id.strip()
         
         if not tmdb_id.isdigit():
-            logger.error(f"{LOG_PREFIX_INPUT} TMDb ID must be a positive integer.")
+            logger.error("%s TMDb ID must be a positive integer.", LOG_PREFIX_INPUT)
             raise InvalidTMDbIDError("TMDb ID must be a positive integer.")
         
-        details = search_tmdb(logger, search_type, tmdb_api_key, tmdb_url, tmdb_id=tmdb_id)
+        details = search_tmdb(logger, search_type, tmdb_api_key, tmdb_url, tmdb_id=tmdb_id, no_cache=args.no_cache)
     # Search by name if provided
     elif args.name:
         name = args.name
-        results = search_tmdb(logger, search_type, tmdb_api_key, tmdb_url, name=name)
+        results = search_tmdb(logger, search_type, tmdb_api_key, tmdb_url, name=name, no_cache=args.no_cache)
         selected_result = select_tmdb_result(logger, results)
 
         if selected_result:
-            logger.info(f"{LOG_PREFIX_SEARCH} TMDb ID '{selected_result['id']}' found from search results.")
-            details = search_tmdb(logger, search_type, tmdb_api_key, tmdb_url, tmdb_id=selected_result['id'])
+            logger.info("%s TMDb ID '%s' found from search results.", LOG_PREFIX_SEARCH, selected_result['id'])
+            details = search_tmdb(logger, search_type, tmdb_api_key, tmdb_url, tmdb_id=selected_result['id'], no_cache=args.no_cache)
         else:
-            logger.error(f"{LOG_PREFIX_INPUT} No suitable result selected.")
+            logger.error("%s No suitable result selected.", LOG_PREFIX_INPUT)
             raise NoSuitableResultError("No suitable result selected.")
     else:
-        logger.error(f"{LOG_PREFIX_INPUT} Please specify either --id or --name to search.")
+        logger.error("%s Please specify either --id or --name to search.", LOG_PREFIX_INPUT)
         raise MissingArgumentError("Please specify either --id or --name to search.")
     
     # Set media_type if arg is passed
@@ -90,7 +91,7 @@ def perform_search(logger, args, tmdb_api_key, tmdb_url, trackers):
     title = display_movie_details(logger, details)
 
     # Query tracker APIs using the TMDb ID
-    query_tracker_api(logger, details['id'], title, search_query, media_type, trackers, args.json, OUTPUT_DIR)
+    query_tracker_api(logger, details['id'], title, search_query, media_type, trackers, args.json, OUTPUT_DIR, args.pretty, args.no_cache)
 
 def handle_errors(logger):
     """Decorator to handle errors."""
@@ -98,43 +99,39 @@ def handle_errors(logger):
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)  # Allow any arguments
-            except MissingArgumentError as e:
-                logger.error(f"{LOG_PREFIX_INPUT} {str(e)}")
-                console.print(f"[bold red]Error:[/bold red] {str(e)}")
-            except InvalidTMDbIDError as e:
-                logger.error(f"{LOG_PREFIX_INPUT} {str(e)}")
-                console.print(f"[bold red]Error:[/bold red] {str(e)}")
-            except NoSuitableResultError as e:
-                logger.error(f"{LOG_PREFIX_INPUT} {str(e)}")
-                console.print(f"[bold red]Error:[/bold red] {str(e)}")
-            except ValueError as e:
-                logger.error(f"{LOG_PREFIX_INPUT} {str(e)}")
-                console.print(f"[bold red]Error:[/bold red] {str(e)}")
+            except UserAbortError as e:
+                logger.info("%s %s", LOG_PREFIX_INPUT, e)
+            except (MissingEnvironmentVariableError, NoValidTrackersError) as e:
+                # Already logged with context by validate_env_vars
+                console.print("[bold red]Error:[/bold red]", e)
+            except (MissingArgumentError, InvalidTMDbIDError, NoSuitableResultError, ValueError) as e:
+                logger.error("%s %s", LOG_PREFIX_INPUT, e)
+                console.print("[bold red]Error:[/bold red]", e)
             except Exception as e:
-                logger.error(f"{LOG_PREFIX_INPUT} An unexpected error occurred: {str(e)}")
-                console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
+                logger.error("%s An unexpected error occurred: %s", LOG_PREFIX_INPUT, e)
+                console.print("[bold red]Unexpected Error:[/bold red]", e)
         return wrapper
     return decorator
 
 def main() -> None:
     """Main function to execute the script."""
     # Setup environment variables
-    logger.info(f"{LOG_PREFIX_TASK} Setting up environment variables...")
+    logger.info("%s Setting up environment variables...", LOG_PREFIX_TASK)
     tmdb_api_key, tmdb_url, trackers = setup(args, logger)
 
-    logger.info(f"{LOG_PREFIX_TASK} Starting script execution...")
+    logger.info("%s Starting script execution...", LOG_PREFIX_TASK)
 
     # Perform the search based on the provided arguments
     perform_search(logger, args, tmdb_api_key, tmdb_url, trackers)
 
-    logger.info(f"{LOG_PREFIX_TASK} Script execution completed.")
+    logger.info("%s Script execution completed.", LOG_PREFIX_TASK)
     console.print("")
     console.rule("[bold green]Script execution completed.[/bold green]", align="center")
 
     # Log summary only if counting_handler exists
     if counting_handler:
-        logger.info(f"{LOG_PREFIX_SUMMARY} Total warnings: {counting_handler.warning_count}")
-        logger.info(f"{LOG_PREFIX_SUMMARY} Total errors: {counting_handler.error_count}")
+        logger.info("%s Total warnings: %s", LOG_PREFIX_SUMMARY, counting_handler.warning_count)
+        logger.info("%s Total errors: %s", LOG_PREFIX_SUMMARY, counting_handler.error_count)
 
 if __name__ == "__main__":
     # Parse command-line arguments
@@ -145,7 +142,7 @@ if __name__ == "__main__":
         OUTPUT_DIR,
         enable_logging=args.logging, 
         debug_mode=args.debug, 
-        sensitive_values=list(API_KEYS.values())
+        sensitive_values=get_api_key_values()
     )
 
     # Handle cases where logging is disabled
@@ -162,10 +159,13 @@ if __name__ == "__main__":
     try:
         main_with_logging()
     except Exception as e:
-        if logger and isinstance(logger.handlers[0], NullHandler):
+        if logger is _NULL_LOGGER:
             # Logging is disabled; print error to the console
-            console.print(f"[bold red]Unhandled exception occurred:[/bold red] {str(e)}")
+            console.print("[bold red]Unhandled exception occurred:[/bold red]", e)
         else:
             # Log the error if logging is enabled
             logger.error("Unhandled exception occurred:", exc_info=True)
-        raise  # Re-raise the exception for visibility
\ No newline at end of file
+        raise  # Re-raise the exception for visibility
+    finally:
+        # Release pooled HTTP connections
+        close_sessions()
\ No newline at end of file
@@ -0,0 +1,138 @@
+# Standard library imports
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+# Default on-disk cache location
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "media-finder"
+
+class DiskCache:
+    """File-backed cache storing one JSON document per key alongside its expiry time."""
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._pruned = False
+        self._prune_lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    @staticmethod
+    def _read_entry(path: Path) -> Optional[dict]:
+        """
+        Read one cache file.
+        Returns:
+            The decoded entry, or None if the file is missing, unreadable, or not a cache entry.
+        """
+        try:
+            with path.open("r", encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        # A readable file that is not a cache entry, e.g. a JSON list, counts as a miss
+        if not isinstance(entry, dict):
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value, deleting its file once it has expired.
+        Returns:
+            The cached value, or None if it is missing, unreadable, or expired.
+        """
+        path = self._path(key)
+        entry = self._read_entry(path)
+        if entry is None:
+            return None
+
+        if entry.get("expires", 0) < time.time():
+            # Expired entries can hold account-specific data, so they are not left on disk
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        return entry.get("value")
+
+    def prune(self) -> None:
+        """
+        Delete every expired or unreadable entry in the cache directory.
+        """
+        now = time.time()
+        for path in self.directory.glob("*.json"):
+            entry = self._read_entry(path)
+            if entry is None or entry.get("expires", 0) < now:
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def set(self, key: str, value: Any, expire: float) -> None:
+        """
+        Store a JSON-serializable value that expires after `expire` seconds.
+        The first store in each process also prunes entries left behind by earlier runs.
+        """
+        # Entries can hold account-specific data, so only the current user may read them
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        # Sweep once per process so the directory does not grow with every title and tracker looked up
+        with self._prune_lock:
+            if not self._pruned:
+                self._pruned = True
+                self.prune()
+
+        path = self._path(key)
+
+        # Write to a private temporary file first so readers never see a partial entry
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump({"expires": time.time() + expire, "value": value}, cache_file, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Never leave a partial temporary file behind, e.g. when the value is not serializable
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache whose entries expire after a per-entry TTL."""
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+        Returns:
+            The cached value, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expire: float) -> None:
+        """
+        Store a value that expires after `expire` seconds, evicting the least recently used entry when full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + expire, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -1,88 +1,85 @@
 # Standard library imports
 import logging
+import os
 import sys
 from pathlib import Path
-from textwrap import dedent
-
-# Third-party library imports
-from rich.console import Console
+from typing import Union
 
 # Local imports
 from utils.exceptions import EnvFileCreationError
+from utils.helpers import console, write_file_bytes
 from utils.logger import LOG_PREFIX_CONFIG
+from utils.trackers import TRACKER_CONFIG
 
-console = Console()
-
-# Define the environment file content
-ENV_CONTENT = dedent("""
-    # TMDb API Key
-    TMDB_API_KEY=
-
-    # TMDb Site URL
-    TMDB_URL=https://api.themoviedb.org/3/
-
-    # Site API Keys
-    ATH_API_KEY=
-    BHD_API_KEY=
-    BLU_API_KEY=
-    FNP_API_KEY=
-    LDU_API_KEY=
-    LST_API_KEY=
-    OTW_API_KEY=
-    OE_API_KEY=
-    RFX_API_KEY=
-    ULCX_API_KEY=
-
-    # Site URLs
-    ATH_URL=https://aither.cc/api/torrents/filter
-    BHD_URL=https://beyond-hd.me/api/torrents/filter
-    BLU_URL=https://blutopia.cc/api/torrents/filter
-    FNP_URL=https://fearnopeer.com/api/torrents/filter
-    LDU_URL=https://theldu.to/api/torrents/filter
-    LST_URL=https://lst.gg/api/torrents/filter
-    OTW_URL=https://oldtoons.world/api/torrents/filter
-    OE_URL=https://onlyencodes.cc/api/torrents/filter
-    RFX_URL=https://reelflix.cc/api/torrents/filter
-    ULCX_URL=https://upload.cx/api/torrents/filter
-""")
+def render_env() -> bytes:
+    """
+    Render the preset .env file content from the shared tracker table.
+    Returns:
+        bytes: The UTF-8 encoded .env template.
+    """
+    lines = [
+        "",
+        "# TMDb API Key",
+        "TMDB_API_KEY=",
+        "",
+        "# TMDb Site URL",
+        "TMDB_URL=https://api.themoviedb.org/3/",
+        "",
+        "# Site API Keys",
+        *(f"{site['key']}_API_KEY=" for site in TRACKER_CONFIG),
+        "",
+        "# Site URLs",
+        *(f"{site['key']}_URL={site['url']}" for site in TRACKER_CONFIG),
+        "",
+    ]
+    return "\n".join(lines).encode("utf-8")
 
 def create_env_file(
     logger: logging.Logger, 
-    file_path: str = "config/.env", 
+    file_path: Union[str, Path] = "config/.env", 
     overwrite: bool = False
 ) -> None:
     """
     Create an .env file with preset values if it does not already exist or overwrite is enabled.
     """
-    file_path = Path(file_path)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
+
+    try:
+        payload = render_env()
 
-    # Handle existing file cases
-    if file_path.exists():
-        if overwrite:
+        try:
+            # Create the file only if it is missing; the existence check and creation are one syscall
+            try:
+                write_file_bytes(file_path, payload, mode=0o600, exclusive=True)
+            except FileNotFoundError:
+                # The config directory is only created when it is actually missing
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                write_file_bytes(file_path, payload, mode=0o600, exclusive=True)
+        except FileExistsError:
+            if not overwrite:
+                message = f"{file_path} already exists. Skipping creation."
+                logger.info("%s %s", LOG_PREFIX_CONFIG, message)
+                return
+
+            # Replace the existing file atomically
             message = f"{file_path} exists but will be overwritten."
             console.print(f"[bold yellow]{message}[/bold yellow]")
-            logger.info(f"{LOG_PREFIX_CONFIG} {message}")
-        else:
-            message = f"{file_path} already exists. Skipping creation."
-            logger.info(f"{LOG_PREFIX_CONFIG} {message}")
-            return
-
-    try:
-        # Write the .env file with preset content
-        file_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
-        with file_path.open("w", encoding="utf-8") as file:
-            file.write(ENV_CONTENT)
+            logger.info("%s %s", LOG_PREFIX_CONFIG, message)
+            tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+            write_file_bytes(tmp_path, payload, mode=0o600)
+            os.replace(tmp_path, file_path)
 
         message = f"{file_path} has been created. Please edit the file with your configuration values and rerun the script."
         console.print(f"[bold green]{message}[/bold green]")
-        logger.info(f"{LOG_PREFIX_CONFIG} {message}")
+        logger.info("%s %s", LOG_PREFIX_CONFIG, message)
         sys.exit(0)  # Exit the script after creating the file
 
     except (FileNotFoundError, PermissionError, IOError) as e:
         error_type = type(e).__name__
-        logger.error(f"{LOG_PREFIX_CONFIG} {error_type}: {str(e)}")
+        logger.error("%s %s: %s", LOG_PREFIX_CONFIG, error_type, e)
         raise EnvFileCreationError(file_path, f"{error_type}: {str(e)}")
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_CONFIG} An unexpected error occurred: {str(e)}")
+        logger.error("%s An unexpected error occurred: %s", LOG_PREFIX_CONFIG, e)
         raise EnvFileCreationError(file_path, f"An unexpected error occurred: {str(e)}")
\ No newline at end of file
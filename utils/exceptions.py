@@ -50,4 +50,18 @@ class InvalidChoiceError(Exception):
     """Exception raised when the user makes an invalid choice."""
     def __init__(self, message="Invalid choice made by the user."):
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class UserAbortError(Exception):
+    """Exception raised when the user declines every offered result."""
+    def __init__(self, message="User aborted the selection."):
+        self.message = message
+        super().__init__(self.message)
+
+class ServiceOverloadError(Exception):
+    """Exception raised when a remote service signals it is overloaded (HTTP 429/503)."""
+    def __init__(self, url, status_code, message="Service overloaded"):
+        self.url = url
+        self.status_code = status_code
+        self.message = f"{message} ({status_code}): {url}"
+        super().__init__(self.message)
@@ -1,15 +1,21 @@
 # Standard library imports
 import argparse
-import json
 import logging
+import os
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
 # Third-party library imports
 from rich.console import Console
+from rich.padding import Padding
 from rich.table import Table
+from rich.text import Text
 
 # Local imports
+from utils import json_codec
 from utils.logger import (
     LOG_PREFIX_JSON,
     LOG_PREFIX_OUTPUT,
@@ -19,11 +25,34 @@ from utils.logger import (
 
 console = Console()
 
-def parse_arguments() -> argparse.Namespace:
+# Allowed --type values and their canonical forms (read-only)
+ALLOWED_MEDIA_TYPES = MappingProxyType({
+    "remux": "Remux",
+    "web-dl": "WEB-DL",
+    "encode": "Encode",
+    "full disc": "Full Disc",
+    "webrip": "WEBRip",
+    "hdtv": "HDTV",
+})
+ALLOWED_MEDIA_TYPES_MSG = f"Allowed types are: {', '.join(ALLOWED_MEDIA_TYPES.values())}"
+
+# Number of bytes in one GiB, and the label shown for missing or invalid sizes
+BYTES_PER_GIB = 1 << 30
+ZERO_GIB = "0.00 GiB"
+
+# Result counts above this are written as plain text rather than a Rich table
+PLAIN_TEXT_THRESHOLD = 200
+RESULT_HEADER_LINE = "Name\tSize\tSeeders\tLeechers\tFreeleech"
+
+# One blank line above each table, in (top, right, bottom, left) order
+TABLE_PADDING = (1, 0, 0, 0)
+
+@lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line parser once; later calls reuse the same instance.
     Returns:
-        argparse.Namespace: Parsed command-line arguments.
+        argparse.ArgumentParser: The configured argument parser.
     """
     parser = argparse.ArgumentParser(
         description="Fetch movie/series details from TMDb using a TMDb ID or name."
@@ -73,6 +102,16 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Save JSON responses for each site."
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent saved JSON responses for readability."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk TMDb and tracker response caches."
+    )
     parser.add_argument(
         "--overwrite",
         action="store_true",
@@ -84,7 +123,15 @@ def parse_arguments() -> argparse.Namespace:
         help="Search for only the specific media type.",
     )
 
-    return parser.parse_args()
+    return parser
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    Returns:
+        argparse.Namespace: Parsed command-line arguments.
+    """
+    return build_parser().parse_args()
 
 def validate_media_type(value: str) -> str:
     """
@@ -99,25 +146,15 @@ def validate_media_type(value: str) -> str:
     Raises:
         argparse.ArgumentTypeError: If the input is not a valid media type.
     """
-    # Define allowed types and their canonical forms
-    allowed_types = {
-        "remux": "Remux",
-        "web-dl": "WEB-DL",
-        "encode": "Encode",
-        "full disc": "Full Disc",
-        "webrip": "WEBRip",
-        "hdtv": "HDTV",
-    }
-
     # Normalize input for validation
-    value_lower = value.lower()
-    if value_lower not in allowed_types:
+    canonical = ALLOWED_MEDIA_TYPES.get(value.lower())
+    if canonical is None:
         raise argparse.ArgumentTypeError(
-            f"Invalid media type: {value}. Allowed types are: {', '.join(allowed_types.values())}"
+            f"Invalid media type: {value}. {ALLOWED_MEDIA_TYPES_MSG}"
         )
 
     # Return the canonical form
-    return allowed_types[value_lower]
+    return canonical
 
 def display_movie_details(logger: logging.Logger, details: Dict[str, Any]) -> Optional[str]:
     """
@@ -125,13 +162,16 @@ def display_movie_details(logger: logging.Logger, details: Dict[str, Any]) -> Op
     Returns:
         Optional[str]: The title of the movie/series if available, otherwise None.
     """
+    table_name = "Movie/Series Details"
+
     try:
-        # Extract details with fallbacks
-        title = details.get("title", details.get("name", "N/A"))
-        release_date = details.get("release_date", details.get("first_air_date", "N/A"))
-        genres = ", ".join(genre.get("name", "Unknown") for genre in details.get("genres", []))
-        runtime = details.get("runtime", None)
-        overview = details.get("overview", "No overview available.")
+        # Extract details with fallbacks; `or` only looks up the alternate key when the first is missing or empty
+        get = details.get
+        title = get("title") or get("name") or "N/A"
+        release_date = get("release_date") or get("first_air_date") or "N/A"
+        genres = ", ".join(genre.get("name", "Unknown") for genre in get("genres") or ())
+        runtime = get("runtime")
+        overview = get("overview", "No overview available.")
 
         # Format runtime
         formatted_runtime = (
@@ -148,7 +188,6 @@ def display_movie_details(logger: logging.Logger, details: Dict[str, Any]) -> Op
         ]
 
         # Define table properties
-        table_name = "Movie/Series Details"
         columns = [("Field", "bold green", "left"), ("Details", "bold yellow", "left")]
 
         # Create and display the table
@@ -160,15 +199,15 @@ def display_movie_details(logger: logging.Logger, details: Dict[str, Any]) -> Op
             title_style="bold green",
             border_style="bold white"
         )
-        logger.info(f"{LOG_PREFIX_OUTPUT} Displaying {table_name} table.")
-        console.print(table)
+        logger.info("%s Displaying %s table.", LOG_PREFIX_OUTPUT, table_name)
+        print_table(table)
 
         return title
 
     except KeyError as e:
-        logger.error(f"{LOG_PREFIX_OUTPUT} KeyError displaying {table_name} table: {str(e)}")
+        logger.error("%s KeyError displaying %s table: %s", LOG_PREFIX_OUTPUT, table_name, e)
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_OUTPUT} Unexpected error displaying {table_name} table: {str(e)}")
+        logger.error("%s Unexpected error displaying %s table: %s", LOG_PREFIX_OUTPUT, table_name, e)
         raise
 
 def display_api_results(
@@ -187,7 +226,7 @@ def display_api_results(
 
         # Filter results if a search query is provided
         if search_query:
-            logger.info(f"{LOG_PREFIX_PROCESS} Filtering {api_name} results for: {search_query}")
+            logger.info("%s Filtering %s results for: %s", LOG_PREFIX_PROCESS, api_name, search_query)
             data = search_results(logger, response_data, search_query)
             filtered_by_search = True
 
@@ -198,20 +237,30 @@ def display_api_results(
                 if filtered_by_search
                 else "No data found."
             )
-            logger.info(f"{LOG_PREFIX_OUTPUT} {api_name} API Results: {message}")
+            logger.info("%s %s API Results: %s", LOG_PREFIX_OUTPUT, api_name, message)
             return
 
-        # Prepare rows for the table
-        rows = [
-            (
-                result["attributes"].get("name", "N/A"),
-                bytes_to_gib(logger, result["attributes"].get("size", 0)),
-                str(result["attributes"].get("seeders", "N/A")),
-                str(result["attributes"].get("leechers", "N/A")),
-                result["attributes"].get("freeleech", "N/A"),
-            )
-            for result in data
-        ]
+        # Prepare rows for the table, reading the five shown attributes through one bound lookup per row
+        rows = []
+        for result in data:
+            get = result["attributes"].get
+            rows.append((
+                get("name", "N/A"),
+                bytes_to_gib(get("size", 0)),
+                str(get("seeders", "N/A")),
+                str(get("leechers", "N/A")),
+                get("freeleech", "N/A"),
+            ))
+
+        table_name = f"{api_name} Results"
+
+        # Write tab-separated rows when output is piped or the result set is too large for Rich's per-cell layout
+        if len(rows) > PLAIN_TEXT_THRESHOLD or not console.is_terminal:
+            lines = [table_name, RESULT_HEADER_LINE, *("\t".join(map(str, row)) for row in rows)]
+            logger.info("%s Displaying %s as plain text.", LOG_PREFIX_OUTPUT, table_name)
+            # console.out skips markup and wrapping but still honours an active console buffer
+            console.out("\n".join(lines), highlight=False)
+            return
 
         # Define table properties
         columns = [
@@ -222,92 +271,101 @@ def display_api_results(
             ("Freeleech", "bold yellow", "center"),
         ]
 
-        table_name = f"{api_name} Results"
+        # Plain Text cells skip markup parsing, so bracketed release names render verbatim
         table = create_table(
             logger,
             title=table_name,
             columns=columns,
-            rows=rows,
+            rows=[[Text(str(cell)) for cell in row] for row in rows],
             title_style="bold green",
             border_style="bold white",
         )
 
         # Log and display the table
-        logger.info(f"{LOG_PREFIX_OUTPUT} Displaying {table_name} table.")
-        console.print(table)
+        logger.info("%s Displaying %s table.", LOG_PREFIX_OUTPUT, table_name)
+        print_table(table)
 
     except KeyError as e:
-        logger.error(f"{LOG_PREFIX_OUTPUT} KeyError in {api_name} table: {e}")
+        logger.error("%s KeyError in %s table: %s", LOG_PREFIX_OUTPUT, api_name, e)
     except TypeError as e:
-        logger.error(f"{LOG_PREFIX_OUTPUT} TypeError in {api_name} table: {e}")
+        logger.error("%s TypeError in %s table: %s", LOG_PREFIX_OUTPUT, api_name, e)
     except ValueError as e:
-        logger.error(f"{LOG_PREFIX_OUTPUT} ValueError in {api_name} table: {e}")
+        logger.error("%s ValueError in %s table: %s", LOG_PREFIX_OUTPUT, api_name, e)
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_OUTPUT} Unexpected error displaying {api_name} table: {e}")
+        logger.error("%s Unexpected error displaying %s table: %s", LOG_PREFIX_OUTPUT, api_name, e)
         raise
 
+@lru_cache(maxsize=128)
+def parse_query_terms(search_query: str) -> Tuple[str, ...]:
+    """
+    Split a `^`-separated search query into lowercase terms, parsed once per distinct query.
+    Longer terms come first since they are the most selective, so non-matching names fail fast.
+    Returns:
+        Tuple[str, ...]: The distinct non-empty, stripped, lowercased search terms.
+    """
+    terms = dict.fromkeys(term for term in (part.strip().lower() for part in search_query.split("^")) if term)
+    return tuple(sorted(terms, key=len, reverse=True))
+
 def search_results(logger: logging.Logger, response_data: Dict[str, Any], query: str) -> List[Any]:
     """
     Search for specific strings in the 'name' attribute of API results.
     Returns:
-        List[Any]: A list of filtered results where the query matches the 'name'.
+        List[Any]: A list of filtered results whose 'name' contains every `^`-separated query term.
     """
     try:
-        # Extract data and filter results
+        # Extract data and split the query into its `^`-separated terms
         results = response_data.get("data", [])
-        query_lower = query.lower()
-
-        filtered_results = [
-            result for result in results
-            if query_lower in result["attributes"].get("name", "").lower()
-        ]
+        query_terms = parse_query_terms(query)
 
-        return filtered_results
+        # Lowercase every name in one pass, then keep the results whose name contains every term
+        names = [result["attributes"].get("name", "").lower() for result in results]
+        return list(compress(results, [all(map(name.__contains__, query_terms)) for name in names]))
 
     except KeyError as e:
         # Handle cases where 'attributes' or 'name' keys are missing
-        logger.error(f"{LOG_PREFIX_PROCESS} KeyError during search: {e}")
+        logger.error("%s KeyError during search: %s", LOG_PREFIX_PROCESS, e)
         return []
 
     except Exception as e:
         # Log unexpected errors
-        logger.error(f"{LOG_PREFIX_PROCESS} Unexpected error during search: {e}")
+        logger.error("%s Unexpected error during search: %s", LOG_PREFIX_PROCESS, e)
         return []
 
-def bytes_to_gib(logger: logging.Logger, size_in_bytes: Optional[int]) -> str:
+@lru_cache(maxsize=4096)
+def _format_gib(size_in_bytes: int) -> str:
     """
-    Convert a size in bytes to a human-readable string in GiB.
+    Format a positive byte count as GiB; release sizes repeat across trackers, so results are cached.
     Returns:
         str: Size in GiB formatted to two decimal places.
     """
-    try:
-        # Validate input and handle invalid or missing values
-        if not isinstance(size_in_bytes, int) or size_in_bytes <= 0:
-            return "0.00 GiB"
+    return f"{size_in_bytes / BYTES_PER_GIB:.2f} GiB"
 
-        # Convert bytes to GiB with precision
-        gib = size_in_bytes / (1024 ** 3)
-        return f"{gib:.2f} GiB"
+def bytes_to_gib(size_in_bytes: Optional[int]) -> str:
+    """
+    Convert a size in bytes to a human-readable string in GiB.
+    Returns:
+        str: Size in GiB formatted to two decimal places.
+    """
+    # Fast path for valid sizes; an exact type check also keeps JSON booleans out of the cache
+    if type(size_in_bytes) is int and size_in_bytes > 0:
+        return _format_gib(size_in_bytes)
 
-    except Exception as e:
-        logger.error(f"{LOG_PREFIX_PROCESS} Error converting bytes to GiB: {e}")
-        return "0.00 GiB"
+    return ZERO_GIB
 
 def create_table(
     logger: logging.Logger,
     title: str,
     columns: List[Tuple[str, str, str]],
-    rows: List[List[str]],
+    rows: Optional[List[List[str]]] = None,
     title_style: str = "bold red",
     border_style: str = "bold white",
 ) -> Table:
     """
     Create a table with the given title, columns, and rows.
+    When `rows` is omitted the table is returned empty so callers can add rows as they build them.
     Returns:
         Table: A formatted rich table ready for display.
     """
-    # Add a spacer for better readability
-    console.print("")
     try:
         # Initialize the table with given styles
         table = Table(title=title, title_style=title_style, border_style=border_style, expand=True)
@@ -316,52 +374,74 @@ def create_table(
         for column_name, style, justify in columns:
             table.add_column(column_name, style=style, justify=justify)
 
-        # Add rows to the table
-        for row in rows:
-            table.add_row(*row)
+        # Add rows to the table; the bound method skips an attribute lookup per row
+        add_row = table.add_row
+        for row in rows or ():
+            add_row(*row)
 
         # Log table creation
-        logger.info(f"{LOG_PREFIX_PROCESS} Created table: {title}")
+        logger.info("%s Created table: %s", LOG_PREFIX_PROCESS, title)
 
         return table
 
     except Exception as e:
         # Log and re-raise any unexpected exceptions
-        logger.error(f"{LOG_PREFIX_PROCESS} Failed to create table '{title}': {e}")
+        logger.error("%s Failed to create table '%s': %s", LOG_PREFIX_PROCESS, title, e)
         raise
 
+def print_table(table: Table) -> None:
+    """
+    Print a table preceded by a blank line, rendered in the same pass as the table itself.
+    """
+    console.print(Padding(table, TABLE_PADDING))
+
+def write_file_bytes(path: Path, payload: bytes, mode: int = 0o644, exclusive: bool = False) -> None:
+    """
+    Write bytes to a file with raw os.write calls, bypassing Python's buffered I/O layer.
+    With `exclusive`, creation and the existence check are one atomic open that raises FileExistsError.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    fd = os.open(path, flags, mode)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 def export_json(
     logger: logging.Logger,
-    output_dir: str,
+    output_dir: Path,
     data: Dict[str, Any],
     tracker_code: str,
     tracker_name: str,
     tmdb_id: str,
+    pretty: bool = False,
 ) -> None:
     """
-    Export the given data to a JSON file.
+    Export the given data to a compact JSON file, or an indented one when `pretty` is set.
+    The caller creates output_dir once before exporting.
     """
     try:
         # Construct the filename
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        filename = output_path / f"{tracker_code}_TMDb_{tmdb_id}.json"
+        filename = output_dir / f"{tracker_code}_TMDb_{tmdb_id}.json"
 
-        # Write the data to the JSON file
-        with open(filename, "w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, ensure_ascii=False, indent=4)
+        # Write the encoded data straight to the file descriptor
+        payload = json_codec.dumps(data, indent=pretty)
+        write_file_bytes(filename, payload)
 
         # Log successful export
-        logger.info(f"{LOG_PREFIX_SAVE} Exported {tracker_name} ({tracker_code}) data to {filename}")
+        logger.info("%s Exported %s (%s) data to %s (%s bytes)", LOG_PREFIX_SAVE, tracker_name, tracker_code, filename, len(payload))
 
     except FileNotFoundError as e:
-        logger.error(f"{LOG_PREFIX_JSON} FileNotFoundError during export: {e}")
+        logger.error("%s FileNotFoundError during export: %s", LOG_PREFIX_JSON, e)
 
     except IOError as e:
-        logger.error(f"{LOG_PREFIX_JSON} IOError during export: {e}")
+        logger.error("%s IOError during export: %s", LOG_PREFIX_JSON, e)
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_JSON} Unexpected error during export: {e}")
+        logger.error("%s Unexpected error during export: %s", LOG_PREFIX_JSON, e)
 
 def display_failed_sites(logger: logging.Logger, failed_sites: Dict[str, str]) -> None:
     """
@@ -376,12 +456,12 @@ def display_failed_sites(logger: logging.Logger, failed_sites: Dict[str, str]) -
 
         # Create and display the table
         table = create_table(logger, title="Failed Sites", columns=columns, rows=rows, title_style="bold red")
-        logger.info(f"{LOG_PREFIX_OUTPUT} Displaying failed sites table.")
-        console.print(table)
+        logger.info("%s Displaying failed sites table.", LOG_PREFIX_OUTPUT)
+        print_table(table)
 
     except Exception as e:
         # Log any unexpected errors
-        logger.error(f"{LOG_PREFIX_OUTPUT} Failed to display failed sites: {e}")
+        logger.error("%s Failed to display failed sites: %s", LOG_PREFIX_OUTPUT, e)
 
 def display_missing_media_types(logger: logging.Logger, missing_media: Dict[str, List[str]]) -> None:
     """
@@ -396,9 +476,9 @@ def display_missing_media_types(logger: logging.Logger, missing_media: Dict[str,
 
         # Create and display the table
         table = create_table(logger, title="Missing Media Types", columns=columns, rows=rows, title_style="bold red")
-        logger.info(f"{LOG_PREFIX_OUTPUT} Displaying missing media types table.")
-        console.print(table)
+        logger.info("%s Displaying missing media types table.", LOG_PREFIX_OUTPUT)
+        print_table(table)
 
     except Exception as e:
         # Log any unexpected errors
-        logger.error(f"{LOG_PREFIX_OUTPUT} Failed to display missing media types: {e}")
\ No newline at end of file
+        logger.error("%s Failed to display missing media types: %s", LOG_PREFIX_OUTPUT, e)
\ No newline at end of file
@@ -0,0 +1,278 @@
+# Standard library imports
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+
+# Third-party library imports
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Local imports
+from utils.exceptions import ServiceOverloadError
+from utils.logger import LOG_PREFIX_API
+
+T = TypeVar("T")
+
+# HTTP status codes that signal the remote service wants us to back off
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+# Longest Retry-After, in seconds, worth waiting for; longer requests give up instead
+MAX_RETRY_DELAY = 30.0
+
+# Connection pool sizing for the shared sessions
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Headers sent on every pooled session; Accept-Encoding is left to requests, which adds br/zstd when available
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+}
+
+# Retry policy for TMDb: back off exponentially on rate limits and server errors
+TMDB_RETRIES = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Default retry policy; overload statuses are left to the adaptive limiter
+DEFAULT_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 504], raise_on_status=False)
+
+def create_session(retries: Optional[Retry] = None) -> requests.Session:
+    """
+    Create a session with a pooled, keep-alive HTTP adapter.
+    Returns:
+        requests.Session: A session that reuses TCP/TLS connections across requests.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retries or DEFAULT_RETRIES,
+    )
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# One session per host so each site keeps its own connection pool
+_HOST_SESSIONS: Dict[str, requests.Session] = {}
+_HOST_SESSIONS_LOCK = threading.Lock()
+
+def get_host_session(url: str, retries: Optional[Retry] = None) -> requests.Session:
+    """
+    Get the shared session for the host of the given URL.
+    The retry policy only applies when the host's session is first created.
+    Returns:
+        requests.Session: The pooled session keyed by the URL's network location.
+    """
+    host = urlparse(url).netloc
+    with _HOST_SESSIONS_LOCK:
+        session = _HOST_SESSIONS.get(host)
+        if session is None:
+            session = _HOST_SESSIONS[host] = create_session(retries)
+        return session
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limiter that halves its limit when the service reports overload
+    and grows it by one on each successful request (AIMD).
+    """
+    def __init__(self, initial_concurrency: int = 4, max_concurrency: int = 8, min_concurrency: int = 1):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.limit = max(min_concurrency, min(initial_concurrency, max_concurrency))
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._condition:
+            self.in_flight -= 1
+            if exc_type is not None and issubclass(exc_type, ServiceOverloadError):
+                self.limit = max(self.min_concurrency, self.limit // 2)
+            elif exc_type is None:
+                self.limit = min(self.max_concurrency, self.limit + 1)
+            self._condition.notify_all()
+        return False
+
+# One limiter per host so a slow or overloaded site does not starve the others
+_HOST_LIMITERS: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+def get_host_limiter(url: str) -> AdaptiveConcurrencyLimiter:
+    """
+    Get the shared limiter for the host of the given URL.
+    Returns:
+        AdaptiveConcurrencyLimiter: The limiter keyed by the URL's network location.
+    """
+    host = urlparse(url).netloc
+    with _HOST_LIMITERS_LOCK:
+        limiter = _HOST_LIMITERS.get(host)
+        if limiter is None:
+            limiter = _HOST_LIMITERS[host] = AdaptiveConcurrencyLimiter()
+        return limiter
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces requests to `rate` per second,
+    allowing bursts of up to `capacity` requests.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, sleeping only for the time still owed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+# Default per-host request pacing
+DEFAULT_RATE_LIMIT = 2.0
+DEFAULT_BURST = 4
+
+# TMDb allows roughly 40 requests per 10 seconds
+TMDB_RATE_LIMIT = 4.0
+TMDB_BURST = 20
+
+# One token bucket per host so unrelated sites never wait on each other
+_HOST_BUCKETS: Dict[str, TokenBucket] = {}
+_HOST_BUCKETS_LOCK = threading.Lock()
+
+def get_host_bucket(url: str, rate: float = DEFAULT_RATE_LIMIT, capacity: float = DEFAULT_BURST) -> TokenBucket:
+    """
+    Get the shared token bucket for the host of the given URL.
+    The rate and capacity only apply when the host's bucket is first created.
+    Returns:
+        TokenBucket: The bucket keyed by the URL's network location.
+    """
+    host = urlparse(url).netloc
+    with _HOST_BUCKETS_LOCK:
+        bucket = _HOST_BUCKETS.get(host)
+        if bucket is None:
+            bucket = _HOST_BUCKETS[host] = TokenBucket(rate, capacity)
+        return bucket
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into one call whose outcome every caller receives.
+    """
+    def __init__(self):
+        self._inflight: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, fn: Callable[[], T]) -> T:
+        """
+        Run `fn` unless a call for `key` is already in flight, in which case wait for that call instead.
+        Returns:
+            The result of the single call made for `key`; its exception is re-raised to every caller.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+def close_sessions() -> None:
+    """
+    Close every pooled host session, releasing their keep-alive connections.
+    """
+    with _HOST_SESSIONS_LOCK:
+        for session in _HOST_SESSIONS.values():
+            session.close()
+        _HOST_SESSIONS.clear()
+
+def _retry_delay(response: requests.Response, attempt: int, backoff_factor: float) -> Optional[float]:
+    """
+    Honor a numeric Retry-After header, otherwise back off exponentially, never beyond MAX_RETRY_DELAY.
+    Returns:
+        Optional[float]: Seconds to wait, or None if the server asks for longer than MAX_RETRY_DELAY.
+    """
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        delay = float(retry_after)
+        return delay if delay <= MAX_RETRY_DELAY else None
+    return min(backoff_factor * (2 ** (attempt - 1)), MAX_RETRY_DELAY)
+
+def limited_get(
+    logger: logging.Logger,
+    url: str,
+    max_attempts: int = 3,
+    backoff_factor: float = 1.0,
+    **kwargs: Any,
+) -> requests.Response:
+    """
+    Send a GET request paced by the host's token bucket and adaptive limiter, retrying on overload.
+    Returns:
+        requests.Response: The final response; overload responses are returned after the last attempt.
+    """
+    limiter = get_host_limiter(url)
+    bucket = get_host_bucket(url)
+    session = get_host_session(url)
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            bucket.acquire()
+            with limiter:
+                response = session.get(url, **kwargs)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s %s Content-Encoding: %s", LOG_PREFIX_API, url, response.headers.get("Content-Encoding"))
+                if response.status_code in OVERLOAD_STATUS_CODES:
+                    raise ServiceOverloadError(url, response.status_code)
+            return response
+
+        except ServiceOverloadError as e:
+            if attempt == max_attempts:
+                logger.warning("%s %s. Giving up after %s attempts.", LOG_PREFIX_API, e.message, attempt)
+                return response
+
+            delay = _retry_delay(response, attempt, backoff_factor)
+            if delay is None:
+                logger.warning(
+                    "%s %s. Retry-After of %ss exceeds %.0fs; giving up.",
+                    LOG_PREFIX_API, e.message, response.headers.get("Retry-After"), MAX_RETRY_DELAY
+                )
+                return response
+
+            logger.warning("%s %s. Retrying in %.1fs (attempt %s/%s).", LOG_PREFIX_API, e.message, delay, attempt, max_attempts)
+            time.sleep(delay)
@@ -0,0 +1,39 @@
+# Standard library imports
+import json
+from typing import Any
+
+# Third-party library imports (optional; falls back to the standard library)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one type covers both backends
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data: bytes) -> Any:
+    """
+    Parse JSON from raw bytes.
+    Returns:
+        Any: The decoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        # orjson reports invalid UTF-8 as a JSONDecodeError, so the fallback does the same
+        raise JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from e
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+    Returns:
+        bytes: The compact encoded JSON document, indented by two spaces when `indent` is set.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -1,9 +1,16 @@
+import atexit
 import logging
+import queue
 import re
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Optional, Sequence
+
+# Name of the application logger; handlers live here rather than on the root logger
+LOGGER_NAME = "media_finder"
 
 # Log Prefix Constants
 LOG_PREFIX_VALIDATE = "[VALIDATE]"
@@ -20,64 +27,96 @@ LOG_PREFIX_TASK = "[TASK]"
 LOG_PREFIX_RESULT = "[RESULT]"
 LOG_PREFIX_SUMMARY = "[SUMMARY]"
 
+@lru_cache(maxsize=8)
+def compile_redaction_pattern(sensitive_values: tuple) -> Optional[re.Pattern]:
+    """
+    Compile every sensitive value into one alternation so each record is scanned once.
+    Returns:
+        Optional[re.Pattern]: The compiled pattern, or None when there is nothing to redact.
+    """
+    escaped = [re.escape(value) for value in sorted(filter(None, set(sensitive_values)), key=len, reverse=True)]
+    if not escaped:
+        return None
+
+    values = "|".join(escaped)
+    # Match sensitive values in different formats: exact, JSON-like, and key-value pair
+    return re.compile(rf"\b(?:{values})\b|(?<=['\"])(?:{values})(?=['\"])|(?<=api_key=)(?:{values})")
+
 class RedactingSensitiveInformation(logging.Formatter):
     """Formatter that redacts sensitive information in log messages."""
     def __init__(self, fmt=None, datefmt=None, sensitive_values=None):
         super().__init__(fmt, datefmt)
         self.sensitive_values = sensitive_values or []
+        self.pattern = compile_redaction_pattern(tuple(self.sensitive_values))
 
     def format(self, record):
         message = super().format(record)
-        for value in self.sensitive_values:
-            if value:
-                # Match sensitive values in different formats
-                patterns = [
-                    rf"\b{re.escape(value)}\b",  # Exact match
-                    rf"(['\"]{re.escape(value)}['\"])",  # JSON-like match
-                    rf"(api_key=){re.escape(value)}"  # Key-value pair match
-                ]
-                for pattern in patterns:
-                    message = re.sub(pattern, r"[REDACTED]", message)
-        return message
+        # Nothing to redact; return the base formatter's output unchanged
+        if self.pattern is None:
+            return message
+        return self.pattern.sub("[REDACTED]", message)
+
+# Background listener writing queued records to the log file; replaced on each setup_logging call
+_listener: Optional[QueueListener] = None
+
+def stop_log_listener() -> None:
+    """
+    Stop the active log listener, flushing queued records and closing its file handler.
+    """
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+# Flush queued records on exit; registered once no matter how often logging is set up
+atexit.register(stop_log_listener)
 
 class CountingHandler(logging.Handler):
-    """Custom handler to count log levels."""
+    """Custom handler to count log levels; records below WARNING are filtered out before emit()."""
     def __init__(self):
-        super().__init__()
+        super().__init__(logging.WARNING)
         self.error_count = 0
         self.warning_count = 0
 
     def emit(self, record):
-        if record.levelno == logging.ERROR:
+        if record.levelno >= logging.ERROR:
             self.error_count += 1
-        elif record.levelno == logging.WARNING:
+        else:
             self.warning_count += 1
 
 def setup_logging(
     output_dir: Path,
     enable_logging: bool = False,
     debug_mode: bool = False,
-    sensitive_values: Optional[List[str]] = None
+    sensitive_values: Optional[Sequence[str]] = None
 ) -> tuple[Logger, CountingHandler] | None:
     """Setup logging configuration with sensitive information redaction."""
     if not enable_logging:
         return None
 
     # Ensure the output directory exists
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Setup log filename
-    now = datetime.now()
     log_prefix = "DEBUG_" if debug_mode else ""
-    log_filename = now.strftime(f"{log_prefix}media_log-%H_%M_%S_%m_%d_%Y.log")
-    log_filepath = Path(output_dir) / log_filename
+    log_filename = datetime.now().strftime(f"{log_prefix}media_log-%H_%M_%S_%m_%d_%Y.log")
+    log_filepath = output_dir / log_filename
+
+    # Create the application logger; third-party records on the root logger never reach our handlers
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.propagate = False
 
-    # Create the root logger
-    logger = logging.getLogger()
+    # Stop the previous listener first so its queued records are flushed and its log file is closed
+    stop_log_listener()
 
-    # --- Remove existing FileHandler instances ---
+    # --- Remove existing FileHandler and QueueHandler instances ---
     for handler in logger.handlers[:]:
-        if isinstance(handler, logging.FileHandler):
+        if isinstance(handler, (logging.FileHandler, QueueHandler)):
             logger.removeHandler(handler)
 
     # Optionally, remove existing CountingHandler instances as well
@@ -97,7 +136,14 @@ def setup_logging(
         sensitive_values=sensitive_values
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # Hand records to a background listener so callers never block on disk writes
+    global _listener
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(queue_handler)
 
     # Create and add a new CountingHandler
     counting_handler = CountingHandler()
@@ -106,14 +152,14 @@ def setup_logging(
     if sensitive_values:
         urllib3_logger = logging.getLogger("urllib3")
         urllib3_logger.handlers.clear()
-        urllib3_logger.addHandler(file_handler)
+        urllib3_logger.addHandler(queue_handler)
         urllib3_logger.setLevel(logging.DEBUG if debug_mode else logging.INFO)
         urllib3_logger.propagate = False
 
     # Log initialization messages
-    logger.info(f"{LOG_PREFIX_TASK} Logging initialized.")
+    logger.info("%s Logging initialized.", LOG_PREFIX_TASK)
     if debug_mode:
-        logger.debug(f"{LOG_PREFIX_TASK} Debug mode enabled. All responses and execution steps will be logged.")
-    logger.info(f"{LOG_PREFIX_TASK} Log file created: {log_filepath.resolve()}")
+        logger.debug("%s Debug mode enabled. All responses and execution steps will be logged.", LOG_PREFIX_TASK)
+    logger.info("%s Log file created: %s", LOG_PREFIX_TASK, log_filepath.resolve())
 
     return logger, counting_handler
\ No newline at end of file
@@ -0,0 +1,14 @@
+# Supported tracker sites: code, display name, and default API endpoint, in .env file order.
+# Shared by the .env template and environment validation so adding a tracker is a single edit here.
+TRACKER_CONFIG = (
+    {"key": "ATH", "name": "Aither", "url": "https://aither.cc/api/torrents/filter"},
+    {"key": "BHD", "name": "BeyondHD", "url": "https://beyond-hd.me/api/torrents/filter"},
+    {"key": "BLU", "name": "Blutopia", "url": "https://blutopia.cc/api/torrents/filter"},
+    {"key": "FNP", "name": "FearNoPeer", "url": "https://fearnopeer.com/api/torrents/filter"},
+    {"key": "LDU", "name": "TheLDU", "url": "https://theldu.to/api/torrents/filter"},
+    {"key": "LST", "name": "L0ST", "url": "https://lst.gg/api/torrents/filter"},
+    {"key": "OTW", "name": "OldToons.World", "url": "https://oldtoons.world/api/torrents/filter"},
+    {"key": "OE", "name": "OnlyEncodes", "url": "https://onlyencodes.cc/api/torrents/filter"},
+    {"key": "RFX", "name": "ReelFliX", "url": "https://reelflix.cc/api/torrents/filter"},
+    {"key": "ULCX", "name": "Upload.cx", "url": "https://upload.cx/api/torrents/filter"},
+)
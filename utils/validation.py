@@ -1,160 +1,184 @@
 # Standard library imports
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional
 
 # Third-party imports
 from dotenv import load_dotenv
-from rich.console import Console
 
 # Local imports
 from utils.create_env import create_env_file
 from utils.exceptions import MissingEnvironmentVariableError, NoValidTrackersError
 from utils.logger import LOG_PREFIX_CONFIG, LOG_PREFIX_PROCESS, LOG_PREFIX_VALIDATE
-
-console = Console()
-
-# Load environment variables from the .env file located in the config directory
-load_dotenv(dotenv_path=Path("config/.env"))
-
-# Tracker site configurations
-TRACKER_CONFIG = [
-    {"key": "ATH", "name": "Aither"},
-    {"key": "BHD", "name": "BeyondHD"},
-    {"key": "BLU", "name": "Blutopia"},
-    {"key": "FNP", "name": "FearNoPeer"},
-    {"key": "LDU", "name": "TheLDU"},
-    {"key": "LST", "name": "L0ST"},
-    {"key": "OTW", "name": "OldToons.World"},
-    {"key": "OE", "name": "OnlyEncodes"},
-    {"key": "RFX", "name": "ReelFliX"},
-    {"key": "ULCX", "name": "Upload.cx"},
-]
-
-# Define media type categories and their synonyms
-MEDIA_TYPES = {
-    "REMUX": {"remux"},
-    "WEB-DL": {"web-dl"},
-    "Encode": {"encode", "x264 encode", "x265 encode"},
-    "Full Disc": {"full disc", "full disk"},
-    "WEBRip": {"webrip", "web-rip"},
-    "HDTV": {"hdtv"},
-}
-
-# Dynamically build API Keys and URLs from tracker configurations
-API_KEYS = {f"{site['key']}_API_KEY": os.getenv(f"{site['key']}_API_KEY") for site in TRACKER_CONFIG}
-URLS = {f"{site['key']}_URL": os.getenv(f"{site['key']}_URL") for site in TRACKER_CONFIG}
-
-# Add TMDB to the keys and URLs separately
-API_KEYS["TMDB_API_KEY"] = os.getenv("TMDB_API_KEY")
-URLS["TMDB_URL"] = os.getenv("TMDB_URL")
+from utils.trackers import TRACKER_CONFIG
+
+# Location of the .env file, relative to the working directory
+ENV_FILE_PATH = Path("config/.env")
+
+class Tracker(NamedTuple):
+    """A configured tracker with a usable API key and URL."""
+    name: str
+    code: str
+    api_key: str
+    url: str
+
+class TrackerSite(NamedTuple):
+    """A supported tracker and the environment variable names that configure it."""
+    api_key_var: str
+    url_var: str
+    name: str
+    code: str
+
+# Define media type categories and their synonyms (immutable; shared by every lookup)
+MEDIA_TYPES = MappingProxyType({
+    "REMUX": frozenset({"remux"}),
+    "WEB-DL": frozenset({"web-dl"}),
+    "Encode": frozenset({"encode", "x264 encode", "x265 encode"}),
+    "Full Disc": frozenset({"full disc", "full disk"}),
+    "WEBRip": frozenset({"webrip", "web-rip"}),
+    "HDTV": frozenset({"hdtv"}),
+})
 
 # Build the tracker site list with API key and URL environment variable names
-TRACKER_SITES = [
-    (
-        f"{site['key']}_API_KEY",
-        f"{site['key']}_URL",
-        site["name"],
-        site["key"]
-    )
+TRACKER_SITES = tuple(
+    TrackerSite(f"{site['key']}_API_KEY", f"{site['key']}_URL", site["name"], site["key"])
     for site in TRACKER_CONFIG
-]
+)
+
+# Error raised when no tracker has both an API key and a URL; the tracker list is fixed
+NO_VALID_TRACKERS_MESSAGE = (
+    "At least one valid tracker API key and URL pair is required from: "
+    + ", ".join(f"{site.name} ({site.code})" for site in TRACKER_SITES)
+)
+
+# Validated environment shared by every validate_env_vars call; reset with clear_env_cache()
+_CACHED_ENV: Optional[Mapping[str, Any]] = None
 
-def validate_env_vars(logger: logging.Logger) -> dict:
+# Every API key variable name, trackers first, then TMDb
+API_KEY_VARS = tuple(site.api_key_var for site in TRACKER_SITES) + ("TMDB_API_KEY",)
+
+@lru_cache(maxsize=1)
+def load_environment() -> None:
+    """
+    Load variables from the .env file into the environment once, on first use rather than at import.
+    """
+    load_dotenv(dotenv_path=ENV_FILE_PATH)
+
+def get_api_key_values() -> tuple:
+    """
+    Collect the configured API keys, loading the .env file first if needed.
+    Returns:
+        tuple: Non-empty API key values as a hashable tuple, e.g. for log redaction.
+    """
+    load_environment()
+    return tuple(value for value in map(os.getenv, API_KEY_VARS) if value)
+
+def clear_env_cache() -> None:
+    """
+    Forget the validated environment so the next validate_env_vars call scans it again.
+    """
+    global _CACHED_ENV
+    _CACHED_ENV = None
+
+def validate_env_vars(logger: logging.Logger) -> Mapping[str, Any]:
     """
     Validate that required environment variables are set.
+    The result is cached for the process whichever logger is passed; call clear_env_cache() after changing the environment.
     Returns:
-        A dictionary containing validated required environment variables and trackers.
+        A read-only mapping of the validated required environment variables and a tuple of trackers.
     """
+    global _CACHED_ENV
+    if _CACHED_ENV is not None:
+        return _CACHED_ENV
+
     try:
         # Required environment variables
         required_keys = ["TMDB_API_KEY", "TMDB_URL"]
 
-        # Check for missing required environment variables
-        missing_required = [key for key in required_keys if not os.getenv(key)]
+        # Read every variable through one bound lookup on the loaded environment
+        load_environment()
+        env_get = os.environ.get
+
+        # Check for missing required environment variables, keeping the values for the result
+        required = {key: env_get(key) for key in required_keys}
+        missing_required = [key for key, value in required.items() if not value]
         if missing_required:
             error_message = f"Missing required environment variables: {', '.join(missing_required)}"
-            logger.error(f"{LOG_PREFIX_VALIDATE} {error_message}")
+            logger.error("%s %s", LOG_PREFIX_VALIDATE, error_message)
             raise MissingEnvironmentVariableError(missing_required)
 
         # Validate tracker API key and URL pairs
         valid_trackers = []
         disabled_trackers = []
 
-        for tracker in TRACKER_CONFIG:
-            api_key_var = f"{tracker['key']}_API_KEY"
-            url_var = f"{tracker['key']}_URL"
-            api_key = API_KEYS.get(api_key_var)
-            url = URLS.get(url_var)
+        for api_key_var, url_var, name, code in TRACKER_SITES:
+            api_key = env_get(api_key_var)
+            url = env_get(url_var)
 
             if api_key and url:
-                valid_trackers.append({
-                    "api_key": api_key,
-                    "url": url,
-                    "name": tracker["name"],
-                    "code": tracker["key"],
-                })
+                valid_trackers.append(Tracker(name, code, api_key, url))
+                logger.info(
+                    "%s %s (%s) | Using provided API key with URL: %s",
+                    LOG_PREFIX_VALIDATE, name, code, url
+                )
             else:
-                disabled_trackers.append({"name": tracker["name"], "code": tracker["key"]})
+                disabled_trackers.append(f"{name} ({code})")
 
         # Log and handle no valid trackers
         if not valid_trackers:
-            error_message = (
-                "At least one valid tracker API key and URL pair is required from: "
-                + ", ".join([f"{tracker['name']} ({tracker['key']})" for tracker in TRACKER_CONFIG])
-            )
-            logger.error(f"{LOG_PREFIX_VALIDATE} {error_message}")
-            raise NoValidTrackersError(error_message)
+            logger.error("%s %s", LOG_PREFIX_VALIDATE, NO_VALID_TRACKERS_MESSAGE)
+            raise NoValidTrackersError(NO_VALID_TRACKERS_MESSAGE)
 
         # Log disabled trackers
         if disabled_trackers:
             logger.warning(
-                f"{LOG_PREFIX_CONFIG} The following trackers are disabled due to missing or empty values: "
-                + ", ".join([f"{tracker['name']} ({tracker['code']})" for tracker in disabled_trackers])
+                "%s The following trackers are disabled due to missing or empty values: %s",
+                LOG_PREFIX_CONFIG, ", ".join(disabled_trackers)
             )
 
         # Log successful validation
-        logger.info(f"{LOG_PREFIX_VALIDATE} Environment variables validated successfully.")
+        logger.info("%s Environment variables validated successfully.", LOG_PREFIX_VALIDATE)
 
-        # Return validated environment variables and trackers
-        return {
-            "required": {key: os.getenv(key) for key in required_keys},
-            "trackers": valid_trackers,
-        }
+        # Cache and return validated environment variables and trackers; read-only so no caller can alter the shared result
+        _CACHED_ENV = MappingProxyType({
+            "required": MappingProxyType(required),
+            "trackers": tuple(valid_trackers),
+        })
+        return _CACHED_ENV
 
     except MissingEnvironmentVariableError as e:
-        logger.error(f"{LOG_PREFIX_CONFIG} Missing environment variables: {e}")
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        logger.error("%s Missing environment variables: %s", LOG_PREFIX_CONFIG, e)
         raise
 
     except NoValidTrackersError as e:
-        logger.error(f"{LOG_PREFIX_CONFIG} No valid trackers: {e}")
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        logger.error("%s No valid trackers: %s", LOG_PREFIX_CONFIG, e)
         raise
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_CONFIG} Unexpected error: {e}")
-        console.print(f"[bold red]An unexpected error occurred:[/bold red] {e}")
+        logger.error("%s Unexpected error: %s", LOG_PREFIX_CONFIG, e)
         raise
 
 
-def setup_environment(overwrite: bool, logger: logging.Logger) -> dict:
+def setup_environment(overwrite: bool, logger: logging.Logger) -> Mapping[str, Any]:
     """
     Set up the environment by creating or validating the .env file.
     Returns:
-        A dictionary containing the validated environment variables.
+        A read-only mapping of the validated environment variables.
     """
     try:
         # Create or overwrite the .env file
-        logger.info(f"{LOG_PREFIX_VALIDATE} Starting environment setup. Overwrite: {overwrite}")
+        logger.info("%s Starting environment setup. Overwrite: %s", LOG_PREFIX_VALIDATE, overwrite)
         create_env_file(logger, overwrite=overwrite)
-        logger.info(f"{LOG_PREFIX_PROCESS} .env file setup completed.")
+        logger.info("%s .env file setup completed.", LOG_PREFIX_PROCESS)
 
         # Validate the environment variables
         env_vars = validate_env_vars(logger)
-        logger.info(f"{LOG_PREFIX_VALIDATE} Environment variables successfully validated.")
+        logger.info("%s Environment variables successfully validated.", LOG_PREFIX_VALIDATE)
         return env_vars
 
     except Exception as e:
-        logger.error(f"{LOG_PREFIX_PROCESS} Failed to set up environment: {e}")
+        logger.error("%s Failed to set up environment: %s", LOG_PREFIX_PROCESS, e)
         raise  # Re-raise the exception to propagate it
\ No newline at end of file